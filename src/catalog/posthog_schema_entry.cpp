@@ -31,7 +31,6 @@
 #include <arrow/c/bridge.h>
 
 #include <cctype>
-#include <iostream>
 
 namespace duckdb {
 
@@ -431,27 +430,30 @@ void PostHogSchemaEntry::LoadTablesIfNeeded(ClientContext &context) {
 			return; // Cache is still valid
 		}
 		// Cache expired, need to refresh
-		std::cerr << "[PostHog] Table cache expired for schema " << name << ", refreshing..." << '\n';
+		POSTHOG_LOG_INFO("Table cache expired for schema %s, refreshing...", name.c_str());
 	}
 
 	if (!posthog_catalog_.IsConnected()) {
-		std::cerr << "[PostHog] Cannot load tables: not connected" << '\n';
+		POSTHOG_LOG_INFO("Cannot load tables: not connected");
 		return;
 	}
 
 	try {
 		const auto &remote_catalog = posthog_catalog_.GetRemoteCatalog();
-		std::cerr << "[PostHog] Loading tables for catalog." << remote_catalog << ".schema." << name << '\n';
+		POSTHOG_LOG_INFO("Loading tables for catalog.%s.schema.%s", remote_catalog.c_str(), name.c_str());
 		auto &client = posthog_catalog_.GetFlightClient();
 		auto list_tables_started_at = SteadyClock::now();
-		auto table_names = client.ListTables(remote_catalog, name);
-		POSTHOG_LOG_DEBUG("Schema '%s': ListTables returned %zu tables in %lld ms", name.c_str(), table_names.size(),
-		                  static_cast<long long>(ElapsedMillis(list_tables_started_at)));
+		// Request schemas until one full listing has succeeded. Later TTL refreshes mostly see tables that are
+		// already cached, so they list names only and hydrate the few new tables individually.
+		bool include_schema = !schemas_listed_once_;
+		auto remote_table_infos = client.ListTableSchemas(remote_catalog, name, include_schema);
+		POSTHOG_LOG_DEBUG("Schema '%s': ListTableSchemas returned %zu tables in %lld ms", name.c_str(),
+		                  remote_table_infos.size(), static_cast<long long>(ElapsedMillis(list_tables_started_at)));
 
 		unordered_set<string> remote_tables;
-		remote_tables.reserve(table_names.size());
-		for (const auto &t : table_names) {
-			remote_tables.insert(t);
+		remote_tables.reserve(remote_table_infos.size());
+		for (const auto &t : remote_table_infos) {
+			remote_tables.insert(t.table_name);
 		}
 
 		// Prune tables that no longer exist remotely.
@@ -463,31 +465,34 @@ void PostHogSchemaEntry::LoadTablesIfNeeded(ClientContext &context) {
 			++it;
 		}
 
-		// Create entries for tables not already in cache
+		// Create entries for tables not already in cache, reusing the schemas returned by the listing.
+		// Tables without a usable schema in the listing fall back to a per-table fetch.
 		size_t created_count = 0;
-		for (const auto &table_name : table_names) {
-			if (table_cache_.find(table_name) == table_cache_.end()) {
-				POSTHOG_LOG_DEBUG("Schema '%s': hydrating table '%s'", name.c_str(), table_name.c_str());
-				CreateTableEntry(context, table_name);
+		for (auto &table_info : remote_table_infos) {
+			if (table_cache_.find(table_info.table_name) == table_cache_.end()) {
+				POSTHOG_LOG_DEBUG("Schema '%s': hydrating table '%s'", name.c_str(), table_info.table_name.c_str());
+				CreateTableEntry(context, table_info.table_name, std::move(table_info.schema));
 				created_count++;
 			}
 		}
 
+		schemas_listed_once_ = true;
 		tables_loaded_ = true;
 		tables_loaded_at_ = std::chrono::steady_clock::now();
-		std::cerr << "[PostHog] Loaded " << table_names.size() << " tables for schema " << name << '\n';
+		POSTHOG_LOG_INFO("Loaded %zu tables for schema %s", remote_table_infos.size(), name.c_str());
 		POSTHOG_LOG_DEBUG("Schema '%s': table load complete (created=%zu cached=%zu total_ms=%lld)", name.c_str(),
 		                  created_count, table_cache_.size(), static_cast<long long>(ElapsedMillis(op_started_at)));
 
 	} catch (const std::exception &e) {
-		std::cerr << "[PostHog] Failed to load tables for schema " << name << ": " << e.what() << '\n';
+		POSTHOG_LOG_INFO("Failed to load tables for schema %s: %s", name.c_str(), e.what());
 		if (IsConnectionFailureMessage(e.what())) {
 			throw CatalogException("PostHog: Not connected to remote server.");
 		}
 	}
 }
 
-void PostHogSchemaEntry::CreateTableEntry(ClientContext &context, const string &table_name) {
+void PostHogSchemaEntry::CreateTableEntry(ClientContext &context, const string &table_name,
+                                          std::shared_ptr<arrow::Schema> arrow_schema) {
 	// Note: Called with tables_mutex_ already held
 	auto op_started_at = SteadyClock::now();
 	POSTHOG_LOG_DEBUG("Schema '%s': CreateTableEntry start table='%s'", name.c_str(), table_name.c_str());
@@ -502,12 +507,14 @@ void PostHogSchemaEntry::CreateTableEntry(ClientContext &context, const string &
 	}
 
 	try {
-		auto &client = posthog_catalog_.GetFlightClient();
-		const auto &remote_catalog = posthog_catalog_.GetRemoteCatalog();
-		auto schema_started_at = SteadyClock::now();
-		auto arrow_schema = client.GetTableSchema(remote_catalog, name, table_name);
-		POSTHOG_LOG_DEBUG("Schema '%s': GetTableSchema('%s') completed in %lld ms", name.c_str(), table_name.c_str(),
-		                  static_cast<long long>(ElapsedMillis(schema_started_at)));
+		if (!arrow_schema) {
+			auto &client = posthog_catalog_.GetFlightClient();
+			const auto &remote_catalog = posthog_catalog_.GetRemoteCatalog();
+			auto schema_started_at = SteadyClock::now();
+			arrow_schema = client.GetTableSchema(remote_catalog, name, table_name);
+			POSTHOG_LOG_DEBUG("Schema '%s': GetTableSchema('%s') completed in %lld ms", name.c_str(),
+			                  table_name.c_str(), static_cast<long long>(ElapsedMillis(schema_started_at)));
+		}
 
 		vector<string> column_names;
 		vector<LogicalType> column_types;
@@ -631,7 +638,7 @@ optional_ptr<CatalogEntry> PostHogSchemaEntry::LookupEntry(CatalogTransaction tr
 
 	// VIEW_ENTRY is required here: DuckDB resolves DROP VIEW (and other view operations)
 	// by looking up the entry as VIEW_ENTRY. Views are stored in table_cache_ because the
-	// remote server's ListTables returns both tables and views indistinguishably.
+	// remote server's GetTables listing returns both tables and views indistinguishably.
 	if (lookup_info.GetCatalogType() != CatalogType::TABLE_ENTRY &&
 	    lookup_info.GetCatalogType() != CatalogType::VIEW_ENTRY) {
 		return nullptr;
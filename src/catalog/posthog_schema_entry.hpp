@@ -12,9 +12,14 @@
 #include "duckdb/catalog/catalog_entry/table_function_catalog_entry.hpp"
 
 #include <unordered_map>
+#include <memory>
 #include <mutex>
 #include <chrono>
 
+namespace arrow {
+class Schema;
+} // namespace arrow
+
 namespace duckdb {
 
 class PostHogCatalog;
@@ -74,8 +79,9 @@ private:
 	// Load tables from remote server (lazy loading)
 	void LoadTablesIfNeeded(ClientContext &context);
 
-	// Create a table entry for a remote table
-	void CreateTableEntry(ClientContext &context, const string &table_name);
+	// Create a table entry for a remote table. When arrow_schema is null it is fetched from the server.
+	void CreateTableEntry(ClientContext &context, const string &table_name,
+	                      std::shared_ptr<arrow::Schema> arrow_schema = nullptr);
 
 	// Get or create a table entry
 	optional_ptr<PostHogTableEntry> GetOrCreateTable(ClientContext &context, const string &table_name);
@@ -87,6 +93,9 @@ private:
 	bool tables_loaded_ = false;
 	std::chrono::steady_clock::time_point tables_loaded_at_;
 	std::unordered_map<string, unique_ptr<PostHogTableEntry>> table_cache_;
+	// Set once a listing that carries table schemas has succeeded. CREATE TABLE/VIEW also populate table_cache_,
+	// so the cache contents alone cannot tell whether the other tables were ever hydrated in bulk.
+	bool schemas_listed_once_ = false;
 
 	// Table function proxy cache (e.g. snapshots(), table_insertions())
 	std::unordered_map<string, unique_ptr<TableFunctionCatalogEntry>> table_function_cache_;
@@ -0,0 +1,59 @@
+//===----------------------------------------------------------------------===//
+//                         PostHog DuckDB Extension
+//
+// execution/posthog_returning.cpp
+//
+//===----------------------------------------------------------------------===//
+
+#include "execution/posthog_returning.hpp"
+
+#include "duckdb/common/allocator.hpp"
+#include "duckdb/common/exception.hpp"
+#include "flight/flight_client.hpp"
+#include "utils/arrow_value.hpp"
+
+namespace duckdb {
+
+void StreamReturningInto(ClientContext &context, ColumnDataCollection &collection, PostHogFlightQueryStream &stream,
+                         const vector<LogicalType> &types, const char *op) {
+	// A FlightInfo without endpoints carries no rows.
+	if (!stream.HasEndpoints()) {
+		return;
+	}
+
+	DataChunk output_chunk;
+	output_chunk.Initialize(Allocator::Get(context), types);
+
+	// Convert batches as they arrive rather than materializing the whole result and combining it.
+	while (true) {
+		auto batch_result = stream.Next();
+		if (!batch_result.ok()) {
+			throw IOException("PostHog: failed to read %s RETURNING batch: %s", op, batch_result.status().ToString());
+		}
+		const auto &batch = batch_result->data;
+		if (!batch) {
+			break;
+		}
+		for (int64_t row_idx = 0; row_idx < batch->num_rows(); row_idx++) {
+			if ((idx_t)output_chunk.size() == STANDARD_VECTOR_SIZE) {
+				collection.Append(output_chunk);
+				output_chunk.Reset();
+			}
+			auto out_row = output_chunk.size();
+			output_chunk.SetCardinality(out_row + 1);
+			for (idx_t col_idx = 0; col_idx < types.size(); col_idx++) {
+				auto scalar_result = batch->column(static_cast<int>(col_idx))->GetScalar(row_idx);
+				if (!scalar_result.ok()) {
+					throw IOException("PostHog: failed to read %s RETURNING scalar: %s", op,
+					                  scalar_result.status().ToString());
+				}
+				output_chunk.SetValue(col_idx, out_row, ArrowScalarToValue(*scalar_result, types[col_idx]));
+			}
+		}
+	}
+	if (output_chunk.size() > 0) {
+		collection.Append(output_chunk);
+	}
+}
+
+} // namespace duckdb
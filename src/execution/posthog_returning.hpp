@@ -0,0 +1,27 @@
+//===----------------------------------------------------------------------===//
+//                         PostHog DuckDB Extension
+//
+// execution/posthog_returning.hpp
+//
+// Shared RETURNING result handling for remote DML operators.
+//===----------------------------------------------------------------------===//
+
+#pragma once
+
+#include "duckdb/common/types/column/column_data_collection.hpp"
+
+namespace duckdb {
+
+class PostHogFlightQueryStream;
+
+/// Drain a RETURNING result stream into `collection`, converting each Flight
+/// batch as it arrives. A result without endpoints is treated as zero rows.
+/// `op` names the statement (e.g. "DELETE") in error messages.
+///
+/// Not reachable yet: UPDATE/MERGE RETURNING are rejected at plan time and
+/// remote DELETE RETURNING fails server-side until #45 lands. Covered by
+/// test/sql/roadmap/delete_returning_multi_batch_remote.test_slow.
+void StreamReturningInto(ClientContext &context, ColumnDataCollection &collection, PostHogFlightQueryStream &stream,
+                         const vector<LogicalType> &types, const char *op);
+
+} // namespace duckdb
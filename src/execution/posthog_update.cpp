@@ -8,12 +8,10 @@
 #include "execution/posthog_update.hpp"
 
 #include "catalog/posthog_catalog.hpp"
-#include "duckdb/common/allocator.hpp"
-#include "duckdb/common/exception.hpp"
 #include "duckdb/common/limits.hpp"
 #include "duckdb/common/numeric_utils.hpp"
+#include "execution/posthog_returning.hpp"
 #include "storage/posthog_transaction.hpp"
-#include "utils/arrow_value.hpp"
 
 namespace duckdb {
 
@@ -57,35 +55,8 @@ SourceResultType PhysicalPostHogUpdate::GetDataInternal(ExecutionContext &contex
 		if (!state.return_chunk) {
 			state.affected_rows = catalog_.GetFlightClient().ExecuteUpdate(non_returning_sql_, remote_txn_id);
 		} else {
-			auto result = catalog_.GetFlightClient().ExecuteQuery(returning_sql_, remote_txn_id);
-			DataChunk output_chunk;
-			output_chunk.Initialize(Allocator::Get(context.client), GetTypes());
-
-			auto combined_result = result->CombineChunksToBatch();
-			if (!combined_result.ok()) {
-				throw IOException("PostHog: failed to combine UPDATE RETURNING batches: %s",
-				                  combined_result.status().ToString());
-			}
-			const auto &combined = *combined_result;
-			for (int64_t row_idx = 0; row_idx < combined->num_rows(); row_idx++) {
-				if ((idx_t)output_chunk.size() == STANDARD_VECTOR_SIZE) {
-					state.return_collection.Append(output_chunk);
-					output_chunk.Reset();
-				}
-				auto out_row = output_chunk.size();
-				output_chunk.SetCardinality(out_row + 1);
-				for (idx_t col_idx = 0; col_idx < GetTypes().size(); col_idx++) {
-					auto scalar_result = combined->column(static_cast<int>(col_idx))->GetScalar(row_idx);
-					if (!scalar_result.ok()) {
-						throw IOException("PostHog: failed to read UPDATE RETURNING scalar: %s",
-						                  scalar_result.status().ToString());
-					}
-					output_chunk.SetValue(col_idx, out_row, ArrowScalarToValue(*scalar_result, GetTypes()[col_idx]));
-				}
-			}
-			if (output_chunk.size() > 0) {
-				state.return_collection.Append(output_chunk);
-			}
+			auto stream = catalog_.GetFlightClient().ExecuteQueryStream(returning_sql_, remote_txn_id);
+			StreamReturningInto(context.client, state.return_collection, *stream, GetTypes(), "UPDATE");
 			state.return_collection.InitializeScan(state.scan_state);
 		}
 		state.initialized = true;
@@ -169,11 +169,73 @@ std::string Base64Encode(const std::string &input) {
 		throw InvalidInputException(message);
 	}
 }
+
+// Transport-level failures (server unreachable, timeouts). Retrying the same RPC with a different shape won't help.
+bool IsConnectionFailureStatus(const arrow::Status &status) {
+	auto detail = arrow::flight::FlightStatusDetail::UnwrapStatus(status);
+	if (detail && (detail->code() == arrow::flight::FlightStatusCode::Unavailable ||
+	               detail->code() == arrow::flight::FlightStatusCode::TimedOut)) {
+		return true;
+	}
+	auto lowered = StringUtil::Lower(status.ToString());
+	return StringUtil::Contains(lowered, "failed to connect") || StringUtil::Contains(lowered, "connection refused") ||
+	       StringUtil::Contains(lowered, "unavailable") || StringUtil::Contains(lowered, "timed out");
+}
+
+// Read a string/large_string cell as a view into the array; nullopt for null cells.
+std::optional<std::string_view> ReadStringCell(const std::shared_ptr<arrow::Array> &array, int64_t row,
+                                               const char *column_name) {
+	switch (array->type_id()) {
+	case arrow::Type::STRING: {
+		auto str_array = std::static_pointer_cast<arrow::StringArray>(array);
+		return str_array->IsNull(row) ? std::nullopt : std::optional<std::string_view>(str_array->GetView(row));
+	}
+	case arrow::Type::LARGE_STRING: {
+		auto str_array = std::static_pointer_cast<arrow::LargeStringArray>(array);
+		return str_array->IsNull(row) ? std::nullopt : std::optional<std::string_view>(str_array->GetView(row));
+	}
+	default:
+		throw std::runtime_error(std::string("PostHog: Unexpected ") + column_name +
+		                         " column type: " + array->type()->ToString());
+	}
+}
+
+// Read a binary/large_binary cell as a view into the array; nullopt for null cells.
+std::optional<std::string_view> ReadBinaryCell(const std::shared_ptr<arrow::Array> &array, int64_t row,
+                                               const char *column_name) {
+	switch (array->type_id()) {
+	case arrow::Type::BINARY: {
+		auto bin_array = std::static_pointer_cast<arrow::BinaryArray>(array);
+		return bin_array->IsNull(row) ? std::nullopt : std::optional<std::string_view>(bin_array->GetView(row));
+	}
+	case arrow::Type::LARGE_BINARY: {
+		auto bin_array = std::static_pointer_cast<arrow::LargeBinaryArray>(array);
+		return bin_array->IsNull(row) ? std::nullopt : std::optional<std::string_view>(bin_array->GetView(row));
+	}
+	default:
+		throw std::runtime_error(std::string("PostHog: Unexpected ") + column_name +
+		                         " column type: " + array->type()->ToString());
+	}
+}
+
+// Deserialize an IPC-encapsulated Arrow schema (Flight SQL GetTables table_schema column).
+// The bytes are wrapped without copying; the returned schema does not reference them.
+arrow::Result<std::shared_ptr<arrow::Schema>> DeserializeIpcSchema(std::string_view schema_bytes) {
+	arrow::ipc::DictionaryMemo dict_memo;
+	auto buffer = std::make_shared<arrow::Buffer>(reinterpret_cast<const uint8_t *>(schema_bytes.data()),
+	                                              static_cast<int64_t>(schema_bytes.size()));
+	arrow::io::BufferReader reader(buffer);
+	return arrow::ipc::ReadSchema(&reader, &dict_memo);
+}
 } // namespace
 
 PostHogFlightClient::PostHogFlightClient(const std::string &endpoint, const std::string &user,
                                          const std::string &password, bool tls_skip_verify)
     : endpoint_(endpoint), user_(user), password_(password) {
+	if (!user_.empty() && !password_.empty()) {
+		basic_auth_header_ = "Basic " + Base64Encode(user_ + ":" + password_);
+	}
+
 	// Parse endpoint and create location
 	auto location_result = arrow::flight::Location::Parse(endpoint);
 	if (!location_result.ok()) {
@@ -322,8 +384,8 @@ arrow::flight::FlightCallOptions PostHogFlightClient::GetCallOptions() const {
 	auto session_token = GetSessionTokenSnapshot();
 
 	// Add HTTP Basic credentials (username/password) for each request.
-	if (!user_.empty() && !password_.empty()) {
-		options.headers.emplace_back("authorization", "Basic " + Base64Encode(user_ + ":" + password_));
+	if (!basic_auth_header_.empty()) {
+		options.headers.emplace_back("authorization", basic_auth_header_);
 	}
 	if (!session_token.empty()) {
 		options.headers.emplace_back(kSessionHeader, session_token);
@@ -340,87 +402,6 @@ arrow::flight::FlightCallOptions PostHogFlightClient::GetCallOptions() const {
 	return options;
 }
 
-std::shared_ptr<arrow::Table> PostHogFlightClient::ExecuteQuery(const std::string &sql,
-                                                                const std::optional<TransactionId> &txn_id) {
-	std::lock_guard<std::mutex> lock(client_mutex_);
-
-	if (!authenticated_) {
-		throw std::runtime_error("PostHog: Not authenticated. Call Authenticate() first.");
-	}
-
-	// Execute the query via Flight SQL Execute RPC
-	arrow::Result<std::unique_ptr<arrow::flight::FlightInfo>> info_result;
-	if (txn_id.has_value()) {
-		arrow::flight::sql::Transaction txn(*txn_id);
-		info_result = sql_client_->Execute(GetCallOptions(), sql, txn);
-	} else {
-		info_result = sql_client_->Execute(GetCallOptions(), sql);
-	}
-	if (!info_result.ok()) {
-		InvalidateSessionTokenIfRetryableLocked("execute query", info_result.status());
-		throw std::runtime_error("PostHog: Query execution failed: " + info_result.status().ToString());
-	}
-
-	auto flight_info = std::move(*info_result);
-
-	// Collect all result batches from all endpoints
-	std::vector<std::shared_ptr<arrow::RecordBatch>> batches;
-	std::shared_ptr<arrow::Schema> result_schema;
-
-	for (const auto &endpoint : flight_info->endpoints()) {
-		// Get the result stream for this endpoint
-		auto stream_result = sql_client_->DoGet(GetCallOptions(), endpoint.ticket);
-		if (!stream_result.ok()) {
-			InvalidateSessionTokenIfRetryableLocked("execute query fetch results", stream_result.status());
-			throw std::runtime_error("PostHog: Failed to fetch results: " + stream_result.status().ToString());
-		}
-
-		auto stream = std::move(*stream_result);
-
-		// Read all batches from the stream
-		while (true) {
-			auto chunk_result = stream->Next();
-			if (!chunk_result.ok()) {
-				InvalidateSessionTokenIfRetryableLocked("execute query read batch", chunk_result.status());
-				throw std::runtime_error("PostHog: Failed to read result batch: " + chunk_result.status().ToString());
-			}
-
-			const auto &chunk = *chunk_result;
-			if (!chunk.data) {
-				break; // End of stream
-			}
-
-			if (!result_schema) {
-				result_schema = chunk.data->schema();
-			}
-			batches.push_back(chunk.data);
-		}
-	}
-
-	// Combine all batches into a single table
-	if (batches.empty()) {
-		// Return empty table - need schema from FlightInfo
-		arrow::ipc::DictionaryMemo memo;
-		auto schema_result = flight_info->GetSchema(&memo);
-		if (schema_result.ok()) {
-			auto empty_result = arrow::Table::MakeEmpty(*schema_result);
-			if (empty_result.ok()) {
-				return *empty_result;
-			}
-		}
-		// Fallback: return empty table with no columns
-		std::vector<std::shared_ptr<arrow::ChunkedArray>> empty_columns;
-		return arrow::Table::Make(arrow::schema({}), empty_columns);
-	}
-
-	auto table_result = arrow::Table::FromRecordBatches(batches);
-	if (!table_result.ok()) {
-		throw std::runtime_error("PostHog: Failed to combine result batches: " + table_result.status().ToString());
-	}
-
-	return *table_result;
-}
-
 int64_t PostHogFlightClient::ExecuteUpdate(const std::string &sql, const std::optional<TransactionId> &txn_id) {
 	std::lock_guard<std::mutex> lock(client_mutex_);
 
@@ -684,32 +665,38 @@ std::vector<PostHogDbSchemaInfo> PostHogFlightClient::ListDbSchemas(const std::s
 	return *result;
 }
 
-std::vector<std::string> PostHogFlightClient::ListTables(const std::string &catalog, const std::string &schema) {
+std::vector<PostHogTableSchemaInfo>
+PostHogFlightClient::ListTableSchemas(const std::string &catalog, const std::string &schema, bool include_schema) {
 	std::lock_guard<std::mutex> lock(client_mutex_);
 	auto op_started_at = SteadyClock::now();
-	POSTHOG_LOG_DEBUG("Flight ListTables start catalog='%s' schema='%s'", catalog.c_str(), schema.c_str());
+	POSTHOG_LOG_DEBUG("Flight ListTableSchemas start catalog='%s' schema='%s' include_schema=%d", catalog.c_str(),
+	                  schema.c_str(), include_schema ? 1 : 0);
 
 	if (!authenticated_) {
 		throw std::runtime_error("PostHog: Not authenticated. Call Authenticate() first.");
 	}
 
-	auto run_once = [&](const std::string &metadata_catalog) -> arrow::Result<std::vector<std::string>> {
+	auto run_once = [&](const std::string &metadata_catalog,
+	                    bool with_schema) -> arrow::Result<std::vector<PostHogTableSchemaInfo>> {
 		// GetTables returns information about tables.
 		// Parameters: catalog, schema_filter_pattern, table_name_filter_pattern, include_schema, table_types
+		// With include_schema=true each row also carries the IPC-serialized table schema, so hydrating a schema
+		// costs one round trip instead of one GetTables call per table.
 		auto get_tables_started_at = SteadyClock::now();
-		auto info_result = sql_client_->GetTables(
-		    GetCallOptions(), metadata_catalog.empty() ? nullptr : &metadata_catalog, &schema, nullptr, false, nullptr);
+		auto info_result = sql_client_->GetTables(GetCallOptions(),
+		                                          metadata_catalog.empty() ? nullptr : &metadata_catalog, &schema,
+		                                          nullptr, with_schema, nullptr);
 		if (!info_result.ok()) {
 			return info_result.status();
 		}
-		POSTHOG_LOG_DEBUG("Flight ListTables GetTables RPC completed in %lld ms",
+		POSTHOG_LOG_DEBUG("Flight ListTableSchemas GetTables RPC completed in %lld ms",
 		                  static_cast<long long>(ElapsedMillis(get_tables_started_at)));
 
-		std::vector<std::string> tables;
+		std::vector<PostHogTableSchemaInfo> tables;
 		auto flight_info = std::move(*info_result);
-		POSTHOG_LOG_DEBUG("Flight ListTables endpoints=%zu", flight_info->endpoints().size());
+		POSTHOG_LOG_DEBUG("Flight ListTableSchemas endpoints=%zu", flight_info->endpoints().size());
 		if (flight_info->endpoints().empty()) {
-			POSTHOG_LOG_DEBUG("Flight ListTables finished with 0 endpoints in %lld ms",
+			POSTHOG_LOG_DEBUG("Flight ListTableSchemas finished with 0 endpoints in %lld ms",
 			                  static_cast<long long>(ElapsedMillis(op_started_at)));
 			return tables;
 		}
@@ -720,7 +707,7 @@ std::vector<std::string> PostHogFlightClient::ListTables(const std::string &cata
 		if (!stream_result.ok()) {
 			return stream_result.status();
 		}
-		POSTHOG_LOG_DEBUG("Flight ListTables DoGet opened in %lld ms",
+		POSTHOG_LOG_DEBUG("Flight ListTableSchemas DoGet opened in %lld ms",
 		                  static_cast<long long>(ElapsedMillis(do_get_started_at)));
 
 		auto stream = std::move(*stream_result);
@@ -735,85 +722,88 @@ std::vector<std::string> PostHogFlightClient::ListTables(const std::string &cata
 
 			const auto &chunk = *chunk_result;
 			if (!chunk.data) {
-				POSTHOG_LOG_DEBUG("Flight ListTables stream drained (chunks=%zu rows=%zu) in %lld ms", chunk_count,
-				                  row_count, static_cast<long long>(ElapsedMillis(op_started_at)));
+				POSTHOG_LOG_DEBUG("Flight ListTableSchemas stream drained (chunks=%zu rows=%zu) in %lld ms",
+				                  chunk_count, row_count, static_cast<long long>(ElapsedMillis(op_started_at)));
 				break;
 			}
 			chunk_count++;
 			row_count += static_cast<size_t>(chunk.data->num_rows());
-			POSTHOG_LOG_DEBUG("Flight ListTables chunk #%zu rows=%lld next_ms=%lld", chunk_count,
+			POSTHOG_LOG_DEBUG("Flight ListTableSchemas chunk #%zu rows=%lld next_ms=%lld", chunk_count,
 			                  static_cast<long long>(chunk.data->num_rows()),
 			                  static_cast<long long>(ElapsedMillis(next_started_at)));
 
 			auto catalog_col = chunk.data->GetColumnByName("catalog_name");
+			auto db_schema_col = chunk.data->GetColumnByName("db_schema_name");
 			auto table_col = chunk.data->GetColumnByName("table_name");
+			auto schema_col = with_schema ? chunk.data->GetColumnByName("table_schema") : nullptr;
 			if (!table_col) {
 				continue;
 			}
 
-			auto row_matches_catalog = [&](int64_t row) -> bool {
-				if (metadata_catalog.empty() || !catalog_col) {
-					return true;
-				}
-				switch (catalog_col->type_id()) {
-				case arrow::Type::STRING: {
-					auto catalog_array = std::static_pointer_cast<arrow::StringArray>(catalog_col);
-					return !catalog_array->IsNull(row) && catalog_array->GetView(row) == metadata_catalog;
+			tables.reserve(tables.size() + static_cast<size_t>(chunk.data->num_rows()));
+			for (int64_t i = 0; i < chunk.data->num_rows(); i++) {
+				if (!metadata_catalog.empty() && catalog_col) {
+					auto catalog_name = ReadStringCell(catalog_col, i, "catalog_name");
+					if (!catalog_name || *catalog_name != metadata_catalog) {
+						continue;
+					}
 				}
-				case arrow::Type::LARGE_STRING: {
-					auto catalog_array = std::static_pointer_cast<arrow::LargeStringArray>(catalog_col);
-					return !catalog_array->IsNull(row) && catalog_array->GetView(row) == metadata_catalog;
+				// The schema argument is a LIKE pattern ('_' matches any character), so rows from sibling schemas
+				// can come back; keep only exact matches so a table never picks up another schema's definition.
+				if (db_schema_col) {
+					auto db_schema_name = ReadStringCell(db_schema_col, i, "db_schema_name");
+					if (!db_schema_name || *db_schema_name != schema) {
+						continue;
+					}
 				}
-				default:
-					throw std::runtime_error("PostHog: Unexpected catalog_name column type: " +
-					                         catalog_col->type()->ToString());
+				auto table_name = ReadStringCell(table_col, i, "table_name");
+				if (!table_name) {
+					continue;
 				}
-			};
 
-			switch (table_col->type_id()) {
-			case arrow::Type::STRING: {
-				auto table_array = std::static_pointer_cast<arrow::StringArray>(table_col);
-				tables.reserve(tables.size() + static_cast<size_t>(table_array->length()));
-				for (int64_t i = 0; i < table_array->length(); i++) {
-					if (!row_matches_catalog(i) || table_array->IsNull(i)) {
-						continue;
-					}
-					tables.emplace_back(table_array->GetView(i));
+				PostHogTableSchemaInfo entry;
+				entry.table_name = std::string(*table_name);
+				std::optional<std::string_view> schema_bytes;
+				if (schema_col) {
+					schema_bytes = ReadBinaryCell(schema_col, i, "table_schema");
 				}
-				break;
-			}
-			case arrow::Type::LARGE_STRING: {
-				auto table_array = std::static_pointer_cast<arrow::LargeStringArray>(table_col);
-				tables.reserve(tables.size() + static_cast<size_t>(table_array->length()));
-				for (int64_t i = 0; i < table_array->length(); i++) {
-					if (!row_matches_catalog(i) || table_array->IsNull(i)) {
-						continue;
+				if (schema_bytes) {
+					auto schema_read_result = DeserializeIpcSchema(*schema_bytes);
+					if (schema_read_result.ok()) {
+						entry.schema = std::move(*schema_read_result);
+					} else {
+						POSTHOG_LOG_DEBUG("Flight ListTableSchemas could not decode schema for '%s': %s",
+						                  entry.table_name.c_str(), schema_read_result.status().ToString().c_str());
 					}
-					tables.emplace_back(table_array->GetView(i));
 				}
-				break;
-			}
-			default:
-				throw std::runtime_error("PostHog: Unexpected table_name column type: " +
-				                         table_col->type()->ToString());
+				tables.push_back(std::move(entry));
 			}
 		}
 
 		return tables;
 	};
 
-	auto result = run_once(catalog);
+	auto result = run_once(catalog, include_schema);
 	if (!result.ok() && ShouldRetryMetadataWithFreshSession(result.status())) {
-		InvalidateSessionTokenLocked("list tables retry", &result.status());
-		result = run_once(catalog);
+		InvalidateSessionTokenLocked("list table schemas retry", &result.status());
+		result = run_once(catalog, include_schema);
+	}
+	if (!result.ok() && include_schema && !IsSessionTokenRetryableStatus(result.status()) &&
+	    !IsConnectionFailureStatus(result.status())) {
+		// A single table whose schema the server cannot serialize (e.g. a broken view) fails the whole
+		// include_schema listing. Fall back to names only; callers fetch schemas per table for rows without one,
+		// so only the broken table is skipped.
+		POSTHOG_LOG_WARN("Flight ListTableSchemas with include_schema failed, retrying without schemas: %s",
+		                 result.status().ToString().c_str());
+		result = run_once(catalog, false);
 	}
 	if (!result.ok()) {
 		throw std::runtime_error("PostHog: Failed to list tables: " + result.status().ToString());
 	}
 
-	POSTHOG_LOG_DEBUG("Flight ListTables done tables=%zu total_ms=%lld", result->size(),
+	POSTHOG_LOG_DEBUG("Flight ListTableSchemas done tables=%zu total_ms=%lld", result->size(),
 	                  static_cast<long long>(ElapsedMillis(op_started_at)));
-	return *result;
+	return std::move(*result);
 }
 
 std::shared_ptr<arrow::Schema>
@@ -886,48 +876,15 @@ PostHogFlightClient::GetTableSchema(const std::string &catalog, const std::strin
 		int64_t row_idx = -1;
 		for (int64_t i = 0; i < chunk.data->num_rows(); i++) {
 			if (!metadata_catalog.empty() && catalog_col) {
-				switch (catalog_col->type_id()) {
-				case arrow::Type::STRING: {
-					auto catalog_array = std::static_pointer_cast<arrow::StringArray>(catalog_col);
-					if (catalog_array->IsNull(i) || catalog_array->GetView(i) != metadata_catalog) {
-						continue;
-					}
-					break;
-				}
-				case arrow::Type::LARGE_STRING: {
-					auto catalog_array = std::static_pointer_cast<arrow::LargeStringArray>(catalog_col);
-					if (catalog_array->IsNull(i) || catalog_array->GetView(i) != metadata_catalog) {
-						continue;
-					}
-					break;
-				}
-				default:
-					throw std::runtime_error("PostHog: Unexpected catalog_name column type: " +
-					                         catalog_col->type()->ToString());
-				}
-			}
-
-			switch (table_name_col->type_id()) {
-			case arrow::Type::STRING: {
-				auto table_name_array = std::static_pointer_cast<arrow::StringArray>(table_name_col);
-				if (!table_name_array->IsNull(i) && table_name_array->GetView(i) == table) {
-					row_idx = i;
-				}
-				break;
-			}
-			case arrow::Type::LARGE_STRING: {
-				auto table_name_array = std::static_pointer_cast<arrow::LargeStringArray>(table_name_col);
-				if (!table_name_array->IsNull(i) && table_name_array->GetView(i) == table) {
-					row_idx = i;
+				auto catalog_name = ReadStringCell(catalog_col, i, "catalog_name");
+				if (!catalog_name || *catalog_name != metadata_catalog) {
+					continue;
 				}
-				break;
-			}
-			default:
-				throw std::runtime_error("PostHog: Unexpected table_name column type: " +
-				                         table_name_col->type()->ToString());
 			}
 
-			if (row_idx >= 0) {
+			auto table_name = ReadStringCell(table_name_col, i, "table_name");
+			if (table_name && *table_name == table) {
+				row_idx = i;
 				break;
 			}
 		}
@@ -936,27 +893,11 @@ PostHogFlightClient::GetTableSchema(const std::string &catalog, const std::strin
 			throw std::runtime_error("PostHog: Table not found in metadata: " + schema + "." + table);
 		}
 
-		std::string_view schema_bytes;
-		switch (schema_col->type_id()) {
-		case arrow::Type::BINARY: {
-			auto schema_array = std::static_pointer_cast<arrow::BinaryArray>(schema_col);
-			if (schema_array->IsNull(row_idx)) {
-				throw std::runtime_error("PostHog: Table schema is null for: " + schema + "." + table);
-			}
-			schema_bytes = schema_array->GetView(row_idx);
-			break;
-		}
-		case arrow::Type::LARGE_BINARY: {
-			auto schema_array = std::static_pointer_cast<arrow::LargeBinaryArray>(schema_col);
-			if (schema_array->IsNull(row_idx)) {
-				throw std::runtime_error("PostHog: Table schema is null for: " + schema + "." + table);
-			}
-			schema_bytes = schema_array->GetView(row_idx);
-			break;
-		}
-		default:
-			throw std::runtime_error("PostHog: Unexpected table_schema column type: " + schema_col->type()->ToString());
+		auto schema_cell = ReadBinaryCell(schema_col, row_idx, "table_schema");
+		if (!schema_cell) {
+			throw std::runtime_error("PostHog: Table schema is null for: " + schema + "." + table);
 		}
+		std::string_view schema_bytes = *schema_cell;
 
 		// Drain remaining chunks so this stream is fully consumed before the next
 		// RPC on a single-connection Flight session.
@@ -979,17 +920,7 @@ PostHogFlightClient::GetTableSchema(const std::string &catalog, const std::strin
 		}
 
 		// Deserialize the Arrow schema from IPC format.
-		arrow::ipc::DictionaryMemo dict_memo;
-		auto buffer = std::make_shared<arrow::Buffer>(reinterpret_cast<const uint8_t *>(schema_bytes.data()),
-		                                              static_cast<int64_t>(schema_bytes.size()));
-		arrow::io::BufferReader reader(buffer);
-
-		auto schema_read_result = arrow::ipc::ReadSchema(&reader, &dict_memo);
-		if (!schema_read_result.ok()) {
-			return schema_read_result.status();
-		}
-
-		return *schema_read_result;
+		return DeserializeIpcSchema(schema_bytes);
 	};
 
 	auto result = run_once(catalog);
@@ -1066,6 +997,10 @@ arrow::Result<std::shared_ptr<arrow::Schema>> PostHogFlightQueryStream::GetSchem
 	return schema_;
 }
 
+bool PostHogFlightQueryStream::HasEndpoints() const {
+	return info_ && !info_->endpoints().empty();
+}
+
 arrow::Result<arrow::flight::FlightStreamChunk> PostHogFlightQueryStream::Next() {
 	while (true) {
 		auto status = OpenReader();
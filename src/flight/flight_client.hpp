@@ -31,6 +31,12 @@ struct PostHogDbSchemaInfo {
 	std::string schema_name;
 };
 
+struct PostHogTableSchemaInfo {
+	std::string table_name;
+	// Null when the server did not return a decodable schema for this table.
+	std::shared_ptr<arrow::Schema> schema;
+};
+
 class PostHogFlightQueryStream {
 public:
 	PostHogFlightQueryStream(arrow::flight::sql::FlightSqlClient &client, std::mutex &client_mutex,
@@ -40,6 +46,9 @@ public:
 	arrow::Result<std::shared_ptr<arrow::Schema>> GetSchema();
 	arrow::Result<arrow::flight::FlightStreamChunk> Next();
 
+	// False when the server returned a FlightInfo with no endpoints (no data to read).
+	bool HasEndpoints() const;
+
 private:
 	arrow::flight::sql::FlightSqlClient &client_;
 	std::mutex &client_mutex_;
@@ -85,10 +94,6 @@ public:
 	// Query Execution
 	//===--------------------------------------------------------------------===//
 
-	// Execute a SQL query and return results as an Arrow Table
-	std::shared_ptr<arrow::Table> ExecuteQuery(const std::string &sql,
-	                                           const std::optional<TransactionId> &txn_id = std::nullopt);
-
 	// Execute a SQL update/DDL statement (Flight SQL StatementUpdate).
 	int64_t ExecuteUpdate(const std::string &sql, const std::optional<TransactionId> &txn_id = std::nullopt);
 
@@ -120,8 +125,11 @@ public:
 	// If catalog is non-empty, the results are filtered to that catalog.
 	std::vector<PostHogDbSchemaInfo> ListDbSchemas(const std::string &catalog);
 
-	// List all tables in a schema
-	std::vector<std::string> ListTables(const std::string &catalog, const std::string &schema);
+	// List all tables in a schema. With include_schema, each entry also carries its Arrow schema (one GetTables RPC
+	// for the whole schema); if the server cannot serve schemas for the listing, the names-only listing is returned.
+	// Entries without a schema must be hydrated with GetTableSchema.
+	std::vector<PostHogTableSchemaInfo> ListTableSchemas(const std::string &catalog, const std::string &schema,
+	                                                     bool include_schema);
 
 	// Get the schema of a specific table
 	std::shared_ptr<arrow::Schema> GetTableSchema(const std::string &catalog, const std::string &schema,
@@ -144,6 +152,8 @@ private:
 	std::string endpoint_;
 	std::string user_;
 	std::string password_;
+	// Precomputed "Basic <base64(user:password)>" value; credentials never change after construction.
+	std::string basic_auth_header_;
 	std::string session_token_;
 	mutable std::mutex session_token_mutex_;
 	bool authenticated_ = false;
@@ -38,6 +38,11 @@ public:
 		return log_level_;
 	}
 
+	// Check whether messages at the given level would be emitted
+	bool IsEnabled(PostHogLogLevel level) const {
+		return level >= log_level_;
+	}
+
 	// Enable/disable timestamps
 	void SetTimestamps(bool enabled) {
 		show_timestamps_ = enabled;
@@ -120,9 +125,7 @@ private:
 			return;
 		}
 
-		std::lock_guard<std::mutex> lock(mutex_);
-
-		// Format the message
+		// Format the message outside the lock
 		char buffer[4096];
 #if defined(__clang__)
 #pragma clang diagnostic push
@@ -133,6 +136,8 @@ private:
 #pragma clang diagnostic pop
 #endif
 
+		// FormatPrefix uses std::localtime (shared static state), so it must run under the lock.
+		std::lock_guard<std::mutex> lock(mutex_);
 		std::cerr << FormatPrefix(level) << buffer << '\n';
 	}
 
@@ -177,10 +182,19 @@ private:
 	std::mutex mutex_;
 };
 
-// Convenience macros for logging
-#define POSTHOG_LOG_DEBUG(...) duckdb::PostHogLogger::Instance().Debug(__VA_ARGS__)
-#define POSTHOG_LOG_INFO(...)  duckdb::PostHogLogger::Instance().Info(__VA_ARGS__)
-#define POSTHOG_LOG_WARN(...)  duckdb::PostHogLogger::Instance().Warn(__VA_ARGS__)
-#define POSTHOG_LOG_ERROR(...) duckdb::PostHogLogger::Instance().Error(__VA_ARGS__)
+// Convenience macros for logging. The level is checked before the arguments are evaluated, so disabled
+// log lines do not pay for argument construction (e.g. status.ToString()) or formatting.
+#define POSTHOG_LOG_AT_LEVEL(LEVEL, METHOD, ...)                                                                       \
+	do {                                                                                                               \
+		auto &posthog_logger_ = duckdb::PostHogLogger::Instance();                                                     \
+		if (posthog_logger_.IsEnabled(duckdb::PostHogLogLevel::LEVEL)) {                                               \
+			posthog_logger_.METHOD(__VA_ARGS__);                                                                       \
+		}                                                                                                              \
+	} while (0)
+
+#define POSTHOG_LOG_DEBUG(...) POSTHOG_LOG_AT_LEVEL(Debug, Debug, __VA_ARGS__)
+#define POSTHOG_LOG_INFO(...)  POSTHOG_LOG_AT_LEVEL(Info, Info, __VA_ARGS__)
+#define POSTHOG_LOG_WARN(...)  POSTHOG_LOG_AT_LEVEL(Warn, Warn, __VA_ARGS__)
+#define POSTHOG_LOG_ERROR(...) POSTHOG_LOG_AT_LEVEL(Error, Error, __VA_ARGS__)
 
 } // namespace duckdb